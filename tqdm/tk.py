@@ -8,8 +8,8 @@ Usage:
 """
 from __future__ import absolute_import, division
 
-import re
 import sys
+from functools import partial
 from warnings import warn
 
 try:
@@ -25,6 +25,8 @@ from .utils import _range
 
 __author__ = {"github.com/": ["richardsheridan", "casperdcl"]}
 __all__ = ['tqdm_tk', 'ttkrange', 'tqdm', 'trange']
+# code objects whose presence on a stack means a Tk mainloop is dispatching
+_MAINLOOP_CODES = frozenset((tkinter.mainloop.__code__, tkinter.Misc.mainloop.__code__))
 
 
 class tqdm_tk(std_tqdm):  # pragma: no cover
@@ -53,7 +55,6 @@ class tqdm_tk(std_tqdm):  # pragma: no cover
             Create a cancel button and set `cancel_callback` to be called
             when the cancel or window close button is clicked.
         """
-        kwargs = kwargs.copy()
         kwargs['gui'] = True
         # convert disable = None to False
         kwargs['disable'] = bool(kwargs.get('disable', False))
@@ -61,6 +62,7 @@ class tqdm_tk(std_tqdm):  # pragma: no cover
         grab = kwargs.pop('grab', False)
         tk_parent = kwargs.pop('tk_parent', None)
         self._cancel_callback = kwargs.pop('cancel_callback', None)
+        self._tk_pbar = None  # remains `None` if disabled
         super(tqdm_tk, self).__init__(*args, **kwargs)
 
         if self.disable:
@@ -81,13 +83,24 @@ class tqdm_tk(std_tqdm):  # pragma: no cover
 
         warn("GUI is experimental/alpha", TqdmExperimentalWarning, stacklevel=2)
         self._tk_dispatching = self._tk_dispatching_helper()
+        self._tk_paint_pending = None  # `after` id of a coalesced `display()`
+        self._tk_paint_key = None  # state seen by the last `display()`
+        self._tk_update_t = 0  # time of the last event-processing `update()`
+        self._tk_in_update = False  # guards against nested `update()` calls
+        # `bar_format` with {bar} removed, recomputed only if it is reassigned
+        self._tk_bar_format_src = self.bar_format
+        self._tk_bar_format = (self.bar_format or "{l_bar}<bar/>{r_bar}").replace(
+            "{bar}", "<bar/>")
 
         self._tk_window.protocol("WM_DELETE_WINDOW", self.cancel)
         self._tk_window.wm_title(self.desc)
         self._tk_window.wm_attributes("-topmost", 1)
-        self._tk_window.after(0, lambda: self._tk_window.wm_attributes("-topmost", 0))
+        self._tk_window.after(0, partial(self._tk_window.wm_attributes, "-topmost", 0))
         self._tk_n_var = tkinter.DoubleVar(self._tk_window, value=0)
         self._tk_text_var = tkinter.StringVar(self._tk_window)
+        # Tcl names of the above, written directly by `_tk_paint()`
+        self._tk_n_name = str(self._tk_n_var)
+        self._tk_text_name = str(self._tk_text_var)
         pbar_frame = ttk.Frame(self._tk_window, padding=5)
         pbar_frame.pack()
         _tk_label = ttk.Label(pbar_frame, textvariable=self._tk_text_var,
@@ -115,38 +128,88 @@ class tqdm_tk(std_tqdm):  # pragma: no cover
         with self.get_lock():
             self._instances.remove(self)
 
-        def _close():
-            self._tk_window.after('idle', self._tk_window.destroy)
-            if not self._tk_dispatching:
-                self._tk_window.update()
-
-        self._tk_window.protocol("WM_DELETE_WINDOW", _close)
+        self._tk_window.protocol("WM_DELETE_WINDOW", self._tk_close)
 
         # if leave is set but we are self-dispatching, the left window is
         # totally unresponsive unless the user manually dispatches
         if not self.leave:
-            _close()
+            self._tk_close()
         elif not self._tk_dispatching:
             if self._warn_leave:
                 warn("leave flag ignored if not in tkinter mainloop",
                      TqdmWarning, stacklevel=2)
-            _close()
+            self._tk_close()
+
+    def _tk_close(self):
+        """destroy the window once pending events are processed"""
+        if self._tk_paint_pending is not None:
+            self._tk_window.after_cancel(self._tk_paint_pending)
+            self._tk_paint_pending = None
+        self._tk_window.after('idle', self._tk_window.destroy)
+        if not self._tk_dispatching:
+            self._tk_update()
+
+    def _tk_update(self):
+        """
+        Process pending Tk events, unless called from within an event handler
+        already being run by this method (e.g. cancel button -> `close()`).
+        """
+        if self._tk_in_update:
+            return
+        self._tk_in_update = True
+        try:
+            self._tk_window.update()
+        finally:
+            self._tk_in_update = False
 
     def clear(self, *_, **__):
         pass
 
     def display(self, *_, **__):
-        self._tk_n_var.set(self.n)
+        cur_t = self._time()
+        # nothing shown has changed if this is the same as for the last call
+        # (elapsed time is bucketed to half-second resolution)
+        key = (self.n, self.total, self.desc, self.postfix,
+               int((cur_t - self.start_t) * 2))
+        changed = key != self._tk_paint_key
+        self._tk_paint_key = key
+        if self._tk_dispatching:
+            if changed and self._tk_paint_pending is None:
+                # coalesce calls arriving faster than the screen can be
+                # refreshed (~60Hz) so only the latest state is painted
+                self._tk_paint_pending = self._tk_window.after(16, self._tk_paint)
+            return
+        if changed:
+            self._tk_paint()
+        if cur_t - self._tk_update_t >= 0.033:
+            # process user events (e.g. cancel) at a bounded ~30Hz rate
+            self._tk_update_t = cur_t
+            self._tk_update()
+        elif changed:
+            # otherwise only flush pending redraws
+            self._tk_window.update_idletasks()
+
+    def _tk_paint(self):
+        self._tk_paint_pending = None
         d = self.format_dict
         # remove {bar}
-        d['bar_format'] = (d['bar_format'] or "{l_bar}<bar/>{r_bar}").replace(
-            "{bar}", "<bar/>")
+        if d['bar_format'] is not self._tk_bar_format_src:
+            self._tk_bar_format_src = d['bar_format']
+            self._tk_bar_format = (d['bar_format'] or "{l_bar}<bar/>{r_bar}").replace(
+                "{bar}", "<bar/>")
+        d['bar_format'] = self._tk_bar_format
         msg = self.format_meter(**d)
-        if '<bar/>' in msg:
-            msg = "".join(re.split(r'\|?<bar/>\|?', msg, 1))
-        self._tk_text_var.set(msg)
-        if not self._tk_dispatching:
-            self._tk_window.update()
+        l_msg, bar, r_msg = msg.partition('<bar/>')
+        if bar:  # strip the bar along with its `|` delimiters
+            if l_msg.endswith('|'):
+                l_msg = l_msg[:-1]
+            if r_msg.startswith('|'):
+                r_msg = r_msg[1:]
+            msg = l_msg + r_msg
+        # bypass the `Variable.set()` wrappers: one Tcl call per variable
+        setvar = self._tk_window.tk.globalsetvar
+        setvar(self._tk_n_name, self.n)
+        setvar(self._tk_text_name, msg)
 
     def set_description(self, desc=None, refresh=True):
         self.set_description_str(desc, refresh)
@@ -156,7 +219,7 @@ class tqdm_tk(std_tqdm):  # pragma: no cover
         if not self.disable:
             self._tk_window.wm_title(desc)
             if refresh and not self._tk_dispatching:
-                self._tk_window.update()
+                self._tk_window.update_idletasks()
 
     def cancel(self):
         """
@@ -175,7 +238,7 @@ class tqdm_tk(std_tqdm):  # pragma: no cover
         ----------
         total  : int or float, optional. Total to use for the new bar.
         """
-        if hasattr(self, '_tk_pbar'):
+        if self._tk_pbar is not None:
             if total is None:
                 self._tk_pbar.configure(maximum=100, mode="indeterminate")
             else:
@@ -185,10 +248,9 @@ class tqdm_tk(std_tqdm):  # pragma: no cover
     @staticmethod
     def _tk_dispatching_helper():
         """determine if Tkinter mainloop is dispatching events"""
-        codes = {tkinter.mainloop.__code__, tkinter.Misc.mainloop.__code__}
         for frame in sys._current_frames().values():
             while frame:
-                if frame.f_code in codes:
+                if frame.f_code in _MAINLOOP_CODES:
                     return True
                 frame = frame.f_back
         return False